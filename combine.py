@@ -5,137 +5,130 @@ import re
 import yaml
 import sys
 import argparse
-from collections import defaultdict
+import functools
+import mmap
+import hashlib
+import json
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import attrgetter
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Front matter between "---" delimiter lines at the very start of raw file data
+# (any newline convention); the match ends where the body's first non-blank byte begins
+_FRONT_MATTER_RE = re.compile(rb'\A---[ \t]*(?:\r\n?|\n)(.*?)(?<=[\r\n])---[ \t]*(?:\r\n?|\n|\Z)\s*', re.S)
+
+# Line classifiers matching the stripped-line checks of the formatter; used with re.M
+_SPACE = r'[^\S\n]*'
+_TABLE_LINE = rf'{_SPACE}\|(?:[^\n]*\|)?{_SPACE}$'
+_LIST_LINE = rf'{_SPACE}- (?=[^\n]*\S)[^\n]*$'
+_NONBLANK_LINE = r'(?=[^\n]*\S)[^\n]*$'
+
+# A run of consecutive table lines or list lines. "after" is set when the run is
+# followed by a non-blank line that does not start a run of its own
+_BLOCK_RUN_RE = re.compile(
+    rf'\n(?P<run>{_TABLE_LINE}(?:\n{_TABLE_LINE})*|{_LIST_LINE}(?:\n{_LIST_LINE})*)'
+    rf'(?:(?=\n(?!{_TABLE_LINE})(?!{_LIST_LINE}){_NONBLANK_LINE})(?P<after>))?',
+    re.M)
+_NONBLANK_RE = re.compile(r'\s*\S')
+_TABLE_RUN_RE = re.compile(rf'\n{_TABLE_LINE}(?:\n{_TABLE_LINE})*', re.M)
+_COMMENT_LIST_RE = re.compile(r'<!--.*?-->\s*\n- ')
+
+# Title to TOC anchor: spaces become hyphens and "(),&" are dropped
+_ANCHOR_TRANS = str.maketrans({' ': '-', '(': None, ')': None, ',': None, '&': None})
+
+FileInfo = namedtuple('FileInfo', 'filepath title parent nav_order content')
+
+# Parsing a file takes a fraction of a millisecond, while starting a process pool costs
+# milliseconds with fork and over 100 ms with spawn; below this many uncached files the
+# pool cannot pay for itself
+POOL_MIN_FILES = 256
+
+# Files at least this large are memory-mapped; below it a plain read is cheaper
+MMAP_MIN_SIZE = 64 * 1024
+
+PANDOC_INPUT_FORMAT = 'markdown+pipe_tables'
+
+CACHE_DIR_NAME = '.combine_cache'
+# Bump whenever the processing below changes so stale cache entries are ignored
+CACHE_VERSION = 8
 
 
 class MarkdownToPDFCompiler:
-    def __init__(self, base_dir, force_overwrite=False):
+    def __init__(self, base_dir, force_overwrite=False, jobs=None, use_cache=True, per_file_ast=False):
         self.base_dir = base_dir
         self.force_overwrite = force_overwrite
+        self.jobs = jobs
+        self.per_file_ast = per_file_ast
+        self.cache_dir = os.path.join(base_dir, CACHE_DIR_NAME) if use_cache else None
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         
-    def extract_yaml_front_matter(self, content):
-        """Extract YAML front matter from content and return a tuple of (front_matter_dict, remaining_content)"""
-        if content.startswith('---'):
-            end_index = content.find('---', 3)
-            if end_index != -1:
-                front_matter = content[3:end_index].strip()
-                remaining_content = content[end_index+3:].strip()
-                try:
-                    front_matter_dict = yaml.safe_load(front_matter)
-                    return front_matter_dict, remaining_content
-                except yaml.YAMLError:
-                    return {}, content
-        return {}, content
-
-    def ensure_proper_markdown_formatting(self, content):
-        """Ensure markdown lists and other elements are properly formatted, but preserve table formatting"""
-        lines = content.split('\n')
-        is_table_line = [line.strip().startswith('|') and line.strip().endswith('|') for line in lines]
-        
-        result_lines = []
-        i = 0
-        while i < len(lines):
-            if is_table_line[i]:
-                # Handle table sections
-                if i > 0 and not is_table_line[i-1] and result_lines and result_lines[-1].strip():
-                    result_lines.append('')
-                
-                while i < len(lines) and is_table_line[i]:
-                    result_lines.append(lines[i])
-                    i += 1
-                
-                if i < len(lines) and not is_table_line[i] and lines[i].strip():
-                    result_lines.append('')
-            else:
-                # Handle non-table content
-                line = lines[i]
-                
-                if (line.strip().startswith('- ') and i > 0 and result_lines and 
-                    result_lines[-1].strip() and not result_lines[-1].strip().startswith('- ')):
-                    result_lines.append('')
-                
-                result_lines.append(line)
-                
-                if (line.strip().startswith('- ') and i < len(lines) - 1 and 
-                    not lines[i+1].strip().startswith('- ') and lines[i+1].strip()):
-                    result_lines.append('')
-                
-                i += 1
-        
-        content = '\n'.join(result_lines)
-        content = re.sub(r'<!--.*?-->\s*\n- ', r'\n\n- ', content)
-        return content
-
-    def is_test_file(self, content):
-        """Check if content indicates this is a test file that should be skipped"""
-        test_indicators = ['doctest:', 'Extension:', '# Preamble']
-        return any(indicator in content[:512] for indicator in test_indicators)
-
     def collect_markdown_files(self):
         """Collect and process markdown files from subdirectories starting with underscore"""
-        md_files = []
-        for root, dirs, files in os.walk(self.base_dir):
-            if root == self.base_dir:
-                continue
-            
-            dir_name = os.path.basename(root)
-            if not dir_name.startswith('_'):
+        filepaths = []
+        # Like os.walk: unreadable directories are skipped and directory symlinks are not followed
+        try:
+            with os.scandir(self.base_dir) as entries:
+                subdirs = [entry.path for entry in entries
+                           if entry.name.startswith('_') and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            subdirs = []
+        
+        for subdir in subdirs:
+            try:
+                with os.scandir(subdir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md') and entry.is_file():
+                            filepaths.append(entry.path)
+            except OSError:
                 continue
-                
-            for file in sorted(files):
-                if file.endswith('.md'):
-                    filepath = os.path.join(root, file)
-                    file_data = self.process_markdown_file(filepath)
-                    if file_data:
-                        md_files.append(file_data)
         
-        return sorted(md_files, key=lambda x: (x['parent'], x['nav_order']))
-
-    def process_markdown_file(self, filepath):
-        """Process a single markdown file and return its data if valid"""
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                if self.is_test_file(content):
-                    print(f"Skipping test file: {filepath}")
-                    return None
-                
-                front_matter, content_without_front_matter = self.extract_yaml_front_matter(content)
-                content_without_front_matter = self.ensure_proper_markdown_formatting(content_without_front_matter)
-                
-                if 'title' in front_matter and 'parent' in front_matter:
-                    return {
-                        'filepath': filepath,
-                        'title': front_matter.get('title', ''),
-                        'parent': front_matter.get('parent', ''),
-                        'nav_order': front_matter.get('nav_order', 999),
-                        'content': content_without_front_matter
-                    }
-        except Exception as e:
-            print(f"Could not read file {filepath}: {e}")
-        return None
+        # Cache hits are a cheap stat and JSON load, so only the misses are worth distributing
+        md_files = []
+        misses = []
+        for filepath in filepaths:
+            cached = load_cached_file_data(self.cache_dir, filepath)
+            if cached is None:
+                misses.append(filepath)
+            elif cached['file_data']:
+                md_files.append(cached['file_data'])
+        
+        process = functools.partial(process_markdown_file, cache_dir=self.cache_dir)
+        workers = self.jobs or os.cpu_count() or 1
+        if workers == 1 or len(misses) < POOL_MIN_FILES:
+            results = map(process, misses)
+        else:
+            # Files are independent, so read/parse them across worker processes
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(process, misses, chunksize=8))
+        
+        md_files.extend(file_data for file_data in results if file_data)
+        # The file path breaks ties so the order does not depend on directory listing order
+        return sorted(md_files, key=attrgetter('parent', 'nav_order', 'filepath'))
 
     def generate_custom_toc(self, md_files):
         """Generate a custom table of contents grouped by parent category"""
-        toc = "# Table of Contents\n\n"
+        parts = ["# Table of Contents\n\n"]
         
         parent_groups = defaultdict(list)
         for file in md_files:
-            parent_groups[file['parent']].append(file)
+            parent_groups[file.parent].append(file)
         
         for parent, files in sorted(parent_groups.items()):
             escaped_parent = parent.replace('&', '\\&')
-            toc += f"## {escaped_parent}\n\n"
+            parts.append(f"## {escaped_parent}\n\n")
             for file in files:
-                anchor = file['title'].lower().replace(' ', '-').replace('(', '').replace(')', '').replace(',', '').replace('&', '')
-                escaped_file_title = file['title'].replace('&', '\\&')
-                toc += f"- [{escaped_file_title}](#{anchor})\n"
-            toc += "\n"
+                anchor = file.title.lower().translate(_ANCHOR_TRANS)
+                escaped_file_title = file.title.replace('&', '\\&')
+                parts.append(f"- [{escaped_file_title}](#{anchor})\n")
+            parts.append("\n")
         
-        toc += "\n\\newpage\n\n"
-        return toc
+        parts.append("\n\\newpage\n\n")
+        return ''.join(parts)
 
     def get_title_from_index(self):
         """Extract title from index.md file in the base directory"""
@@ -146,16 +139,14 @@ class MarkdownToPDFCompiler:
             return "Document Collection"
         
         try:
-            with open(index_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                front_matter, _ = self.extract_yaml_front_matter(content)
+            front_matter = read_front_matter(index_path, os.stat(index_path).st_mtime_ns)
+            
+            if 'title' in front_matter:
+                return front_matter['title']
+            else:
+                print("Warning: No title found in index.md front matter")
+                return "Document Collection"
                 
-                if 'title' in front_matter:
-                    return front_matter['title']
-                else:
-                    print("Warning: No title found in index.md front matter")
-                    return "Document Collection"
-                    
         except Exception as e:
             print(f"Error reading index.md: {e}")
             return "Document Collection"
@@ -187,45 +178,69 @@ class MarkdownToPDFCompiler:
 
     def escape_latex_special_chars(self, content):
         """Escape special LaTeX characters that might cause compilation errors"""
-        lines = content.split('\n')
-        result_lines = []
+        if '&' not in content:
+            return content
         
-        for line in lines:
-            if line.strip().startswith('|') and line.strip().endswith('|'):
-                result_lines.append(line)
-            else:
-                line = line.replace('&', '\\&')
-                result_lines.append(line)
+        # Table rows keep their ampersands; the text between them is escaped in bulk
+        content = '\n' + content
+        parts = []
+        position = 0
+        for match in _TABLE_RUN_RE.finditer(content):
+            parts.append(content[position:match.start()].replace('&', '\\&'))
+            parts.append(match.group())
+            position = match.end()
+        parts.append(content[position:].replace('&', '\\&'))
         
-        return '\n'.join(result_lines)
+        return ''.join(parts)[1:]
 
-    def create_temp_markdown(self, md_files, title):
-        """Create temporary markdown file with all content"""
-        temp_md = tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.md', encoding='utf-8')
-        
-        # Write title page
-        title_page = self.generate_title_page(title)
-        temp_md.write(title_page)
+    def build_markdown_chunks(self, md_files, title):
+        """Build the document as markdown chunks: title page and TOC first, then one chunk per file"""
+        chunks = [self.generate_title_page(title) + self.generate_custom_toc(md_files)]
         
-        # Write TOC
-        custom_toc = self.generate_custom_toc(md_files)
-        temp_md.write(custom_toc)
-        
-        # Write content
         for i, file_info in enumerate(md_files):
-            escaped_title = self.escape_latex_special_chars(file_info['title'])
-            temp_md.write(f"# {escaped_title}\n\n")
-            
-            escaped_content = self.escape_latex_special_chars(file_info['content'])
-            temp_md.write(escaped_content)
+            escaped_title = self.escape_latex_special_chars(file_info.title)
+            parts = [f"# {escaped_title}\n\n", self.escape_latex_special_chars(file_info.content)]
             
             if i < len(md_files) - 1:
-                temp_md.write("\n\n\\newpage\n\n")
+                parts.append("\n\n\\newpage\n\n")
+            chunks.append(''.join(parts))
+        
+        return chunks
+
+    def create_temp_markdown(self, md_files, title):
+        """Create temporary markdown file with all content"""
+        content = ''.join(self.build_markdown_chunks(md_files, title))
         
-        temp_md.close()
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.md') as temp_md:
+            temp_md.write(content.encode('utf-8'))
         return temp_md.name
 
-    def build_pandoc_command(self, temp_md_path, output_pdf_path):
+    def markdown_to_ast(self, markdown):
+        """Parse a markdown chunk into pandoc's JSON AST"""
+        result = subprocess.run(
+            ['pandoc', '-f', PANDOC_INPUT_FORMAT, '-t', 'json'],
+            input=markdown.encode('utf-8'), stdout=subprocess.PIPE, check=True)
+        return json.loads(result.stdout)
+
+    def create_temp_ast(self, md_files, title):
+        """Create temporary pandoc JSON file by parsing each chunk separately and merging the ASTs"""
+        chunks = self.build_markdown_chunks(md_files, title)
+        
+        # Each chunk is parsed by its own pandoc process, so threads are enough to run them side by side
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            documents = list(executor.map(self.markdown_to_ast, chunks))
+        
+        make_header_ids_unique(documents)
+        merged = documents[0]
+        for document in documents[1:]:
+            merged['meta'].update(document['meta'])
+            merged['blocks'].extend(document['blocks'])
+        
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.json') as temp_json:
+            temp_json.write(json.dumps(merged).encode('utf-8'))
+        return temp_json.name
+
+    def build_pandoc_command(self, temp_md_path, output_pdf_path, input_format=PANDOC_INPUT_FORMAT):
         """Build the pandoc command with all necessary arguments"""
         return [
             'pandoc', temp_md_path, '-o', output_pdf_path,
@@ -237,7 +252,7 @@ class MarkdownToPDFCompiler:
             '-V', 'mainfont=Charter',
             '-V', 'linestretch=1.4',
             '--standalone',
-            '-f', 'markdown+pipe_tables',
+            '-f', input_format,
             '--wrap=preserve',
             f'--resource-path={self.script_dir}',
             f'--include-in-header={os.path.join(self.script_dir, "preamble.tex")}',
@@ -246,9 +261,20 @@ class MarkdownToPDFCompiler:
 
     def compile_with_pandoc(self, md_files, output_pdf_path, title):
         """Compile markdown files to PDF using pandoc"""
-        temp_md_path = self.create_temp_markdown(md_files, title)
-        cmd = self.build_pandoc_command(temp_md_path, output_pdf_path)
+        if self.per_file_ast:
+            try:
+                temp_md_path = self.create_temp_ast(md_files, title)
+            except Exception as e:
+                print(f"Error parsing markdown with pandoc: {e}")
+                return
+            cmd = self.build_pandoc_command(temp_md_path, output_pdf_path, input_format='json')
+        else:
+            temp_md_path = self.create_temp_markdown(md_files, title)
+            cmd = self.build_pandoc_command(temp_md_path, output_pdf_path)
 
+        # A long-lived `pandoc server` would avoid pandoc's start-up cost, but the server runs
+        # without file-system or process access, so it cannot run xelatex or read the
+        # preamble/header includes; PDF output needs this subprocess
         try:
             subprocess.run(cmd, check=True)
             print(f'PDF created: {output_pdf_path}')
@@ -321,11 +347,215 @@ class MarkdownToPDFCompiler:
             self.compile_with_pandoc(markdown_files, output_file, document_title)
 
 
+def decode_markdown(data):
+    """Decode raw markdown bytes, normalising newlines the way a text-mode read would"""
+    content = str(data, 'utf-8', 'ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def parse_nav_order(value):
+    """Coerce a front matter nav_order to a number so files sort numerically"""
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 999
+
+
+def is_test_file(head):
+    """Check if the first bytes of a file indicate a test file that should be skipped"""
+    return b'doctest:' in head or b'Extension:' in head or b'# Preamble' in head
+
+
+def extract_yaml_front_matter(data):
+    """Extract YAML front matter from raw file data (bytes or mmap) and return a tuple of (front_matter_dict, remaining_content)"""
+    match = _FRONT_MATTER_RE.match(data)
+    if not match:
+        return {}, decode_markdown(data)
+    try:
+        # Decoded leniently like the body, so a stray non-UTF-8 byte does not drop the file
+        front_matter_dict = yaml.load(decode_markdown(match.group(1)), Loader=SafeLoader) or {}
+    except yaml.YAMLError:
+        return {}, decode_markdown(data)
+    return front_matter_dict, decode_markdown(data[match.end():]).rstrip()
+
+
+def ensure_proper_markdown_formatting(content):
+    """Ensure markdown lists and other elements are properly formatted, but preserve table formatting"""
+    # Every table line contains "|" and every list line "- ", so plain prose needs no work
+    has_list = '- ' in content
+    if not has_list and '|' not in content:
+        return content
+    
+    # Prefix a newline so a table or list on the first line is matched like any other
+    content = '\n' + content
+    
+    def separate_run(match):
+        # Check the preceding line in place rather than slicing and stripping a copy of it
+        line_start = content.rfind('\n', 0, match.start()) + 1
+        before = '\n' if _NONBLANK_RE.match(content, line_start, match.start()) else ''
+        after = '\n' if match.group('after') is not None else ''
+        return f"\n{before}{match.group('run')}{after}"
+    
+    content = _BLOCK_RUN_RE.sub(separate_run, content)[1:]
+    if has_list and '<!--' in content:
+        content = _COMMENT_LIST_RE.sub(r'\n\n- ', content)
+    return content
+
+
+def process_markdown_file(filepath, cache_dir=None):
+    """Read and process a single markdown file, caching the result, and return its data if valid"""
+    try:
+        stat = os.stat(filepath)
+        with open(filepath, 'rb') as f:
+            head = f.read(512)
+            
+            if is_test_file(head):
+                print(f"Skipping test file: {filepath}")
+                return None
+            
+            if stat.st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    front_matter, content_without_front_matter = extract_yaml_front_matter(data)
+            else:
+                front_matter, content_without_front_matter = extract_yaml_front_matter(head + f.read())
+            
+            content_without_front_matter = ensure_proper_markdown_formatting(content_without_front_matter)
+            
+            file_data = None
+            if 'title' in front_matter and 'parent' in front_matter:
+                file_data = FileInfo(
+                    filepath=filepath,
+                    title=front_matter.get('title', ''),
+                    parent=front_matter.get('parent', ''),
+                    nav_order=parse_nav_order(front_matter.get('nav_order', 999)),
+                    content=content_without_front_matter
+                )
+            
+            store_cached_file_data(cache_dir, filepath, stat, file_data)
+            return file_data
+    except Exception as e:
+        print(f"Could not read file {filepath}: {e}")
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def read_front_matter(filepath, mtime):
+    """Read and parse only the front matter block of a file; mtime keys the cache so edits are picked up"""
+    with open(filepath, 'rb') as f:
+        head = f.read(4096)
+        # Front matter is almost always within the first read; keep reading until it closes
+        while head.startswith(b'---') and not _FRONT_MATTER_RE.match(head):
+            chunk = f.read(4096)
+            if not chunk:
+                break
+            head += chunk
+    
+    front_matter, _ = extract_yaml_front_matter(head)
+    return front_matter
+
+
+def get_cache_path(cache_dir, filepath):
+    """Return the cache file path for a markdown file"""
+    key = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f'{key}.json')
+
+
+def load_cached_file_data(cache_dir, filepath):
+    """Return the cached entry for a file if it is still up to date, otherwise None"""
+    if not cache_dir:
+        return None
+    try:
+        stat = os.stat(filepath)
+        # JSON rather than pickle: the cache sits in the content tree, and loading it must not run code
+        with open(get_cache_path(cache_dir, filepath), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        
+        if (entry.get('version') == CACHE_VERSION and entry.get('mtime') == stat.st_mtime_ns
+                and entry.get('size') == stat.st_size):
+            fields = entry['file_data']
+            entry['file_data'] = FileInfo(filepath=filepath, **fields) if fields else None
+            return entry
+    except Exception:
+        pass
+    return None
+
+
+def store_cached_file_data(cache_dir, filepath, stat, file_data):
+    """Store the processed data for a file in the cache directory"""
+    if not cache_dir:
+        return
+    entry = {
+        'version': CACHE_VERSION,
+        'mtime': stat.st_mtime_ns,
+        'size': stat.st_size,
+        # The path is left out and rebound on load, so it always matches the caller's spelling
+        'file_data': {key: value for key, value in file_data._asdict().items() if key != 'filepath'} if file_data else None
+    }
+    try:
+        # Serialise first so values JSON cannot encode (e.g. YAML dates) leave no stray file
+        data = json.dumps(entry)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first so concurrent workers never see a partial entry
+        with tempfile.NamedTemporaryFile('w', dir=cache_dir, delete=False, encoding='utf-8') as f:
+            f.write(data)
+        os.replace(f.name, get_cache_path(cache_dir, filepath))
+    except Exception as e:
+        print(f"Could not write cache for {filepath}: {e}")
+
+
+def make_header_ids_unique(documents):
+    """Suffix header identifiers repeated across separately parsed pandoc ASTs with -1, -2, ..."""
+    # Pandoc only de-duplicates within one document, so a "Scope" heading in every policy
+    # would otherwise share one label; suffixes may differ from a combined parse but stay unique
+    used = set()
+    
+    def visit(node):
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+        elif isinstance(node, dict):
+            if node.get('t') == 'Header':
+                attr = node['c'][1]
+                identifier = attr[0]
+                if identifier:
+                    if identifier in used:
+                        suffix = 1
+                        while f'{identifier}-{suffix}' in used:
+                            suffix += 1
+                        identifier = attr[0] = f'{identifier}-{suffix}'
+                    used.add(identifier)
+            visit(node.get('c'))
+    
+    for document in documents:
+        visit(document['blocks'])
+
+
+def positive_int(value):
+    """Argparse type for options that need a whole number of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Compile markdown files to PDF')
     parser.add_argument('base_dir', nargs='?', help='Base directory containing markdown files')
     parser.add_argument('-f', '--force', action='store_true', help='Overwrite existing output file without prompting')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the processed-file cache')
+    parser.add_argument('--per-file-ast', action='store_true', help="Parse each file to pandoc's JSON AST in parallel and render the merged AST")
+    parser.add_argument('-j', '--jobs', type=positive_int, default=None, help='Number of parallel workers for reading markdown files and, with --per-file-ast, for pandoc parsing (default: CPU count)')
     return parser.parse_args()
 
 
@@ -342,5 +572,5 @@ if __name__ == '__main__':
     args = parse_arguments()
     base_dir = get_base_directory(args)
     
-    compiler = MarkdownToPDFCompiler(base_dir, args.force)
+    compiler = MarkdownToPDFCompiler(base_dir, args.force, args.jobs, not args.no_cache, args.per_file_ast)
     compiler.compile()